@@ -15,7 +15,7 @@ const telegramEventSchema = z.object({
   text: z.string().optional(), // User's text description
   imageUrl: z.string().optional(), // URL to uploaded image
   imageBase64: z.string().optional(), // Base64 encoded image data
-  timestamp: z.number().optional(),
+  timestamp: z.coerce.number().optional(),
   botToken: z.string(), // Bot authentication token
 });
 
@@ -53,7 +53,7 @@ export async function POST(request: NextRequest) {
       "Access-Control-Allow-Headers": "Content-Type",
     };
 
-    const body = await request.json();
+    const body = await readEventBody(request);
 
     // Validate input
     const validationResult = telegramEventSchema.safeParse(body);
@@ -253,6 +253,35 @@ export async function POST(request: NextRequest) {
   }
 }
 
+// The bot uploads photos as multipart form data (raw bytes, no base64
+// inflation); JSON bodies are still accepted for other clients.
+async function readEventBody(request: NextRequest): Promise<unknown> {
+  const contentType = request.headers.get("content-type") || "";
+  if (
+    !contentType.includes("multipart/form-data") &&
+    !contentType.includes("application/x-www-form-urlencoded")
+  ) {
+    return request.json();
+  }
+
+  const form = await request.formData();
+  const body: Record<string, unknown> = {};
+  for (const [key, value] of form.entries()) {
+    if (typeof value === "string") {
+      body[key] = value;
+    }
+  }
+
+  // The vision API expects a data URL, so encode the uploaded image here
+  const image = form.get("image");
+  if (image && typeof image !== "string") {
+    const bytes = Buffer.from(await image.arrayBuffer());
+    body.imageBase64 = `data:${image.type || "image/jpeg"};base64,${bytes.toString("base64")}`;
+  }
+
+  return body;
+}
+
 export async function OPTIONS() {
   return new NextResponse(null, {
     status: 200,
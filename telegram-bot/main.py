@@ -10,10 +10,11 @@ lifecycle steps in the Life app.
 import os
 import logging
 import asyncio
+import time
 import aiohttp
-import base64
+import msgspec
 from io import BytesIO
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Union
 
 from telegram import Update, ReplyKeyboardMarkup, KeyboardButton, ReplyKeyboardRemove
 from telegram.ext import (
@@ -22,9 +23,11 @@ from telegram.ext import (
     MessageHandler,
     filters,
     ContextTypes,
-    ConversationHandler
+    ConversationHandler,
+    TypeHandler
 )
 from telegram.constants import ParseMode
+from telegram.request import HTTPXRequest
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -39,61 +42,136 @@ logger = logging.getLogger(__name__)
 
 # Bot configuration
 BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
-print(BOT_TOKEN)
 API_BASE_URL = os.getenv('LIFE_APP_API_URL', 'https://localhost:3000/api')
 BOT_SECRET = os.getenv('TELEGRAM_BOT_SECRET')
 
+# Status/products lookups should be quick; lifecycle events wait on the
+# server's vision and summary calls, so only bound the connect phase tightly
+LOOKUP_TIMEOUT = aiohttp.ClientTimeout(total=15)
+EVENT_TIMEOUT = aiohttp.ClientTimeout(total=300, sock_connect=5)
+
+# Webhook configuration (falls back to long-polling when no public URL is set)
+WEBHOOK_URL = os.getenv('TELEGRAM_WEBHOOK_URL')
+WEBHOOK_SECRET = os.getenv('TELEGRAM_WEBHOOK_SECRET')
+PORT = int(os.getenv('PORT', '8443'))
+
 # Conversation states
 WAITING_FOR_EVENT = 1
 WAITING_FOR_IMAGE = 2
 WAITING_FOR_DESCRIPTION = 3
 
+# Longest edge (px) of the Telegram photo size sent for analysis
+MAX_PHOTO_DIMENSION = 1024
 
-class LifeBot:
-    def __init__(self):
-        self.app = Application.builder().token(BOT_TOKEN).build()
-        self.setup_handlers()
+# Abandoned conversations are dropped after this many seconds
+CONVERSATION_TIMEOUT = 600
 
-    def setup_handlers(self):
-        """Set up bot command and message handlers"""
+# Upper bounds on concurrent photo downloads and event uploads, limited
+# separately so slow uploads never hold up short Telegram downloads
+MAX_CONCURRENT_DOWNLOADS = 50
+MAX_CONCURRENT_UPLOADS = 50
 
-        # Commands
-        self.app.add_handler(CommandHandler("start", self.start_command))
-        self.app.add_handler(CommandHandler("help", self.help_command))
-        self.app.add_handler(CommandHandler("link", self.link_command))
-        self.app.add_handler(CommandHandler("status", self.status_command))
-        self.app.add_handler(CommandHandler("products", self.products_command))
+# Linked users' /status and /products responses are reused for this many seconds
+API_CACHE_TTL = 30
+API_CACHE_MAX_ENTRIES = 1024
 
-        # Conversation handler for lifecycle events
-        conv_handler = ConversationHandler(
-            entry_points=[
-                MessageHandler(filters.PHOTO, self.handle_photo),
-                MessageHandler(filters.TEXT & ~filters.COMMAND,
-                               self.handle_text_only)
-            ],
-            states={
-                WAITING_FOR_EVENT: [
-                    MessageHandler(filters.TEXT, self.process_lifecycle_event)
-                ],
-                WAITING_FOR_DESCRIPTION: [
-                    MessageHandler(filters.TEXT, self.process_lifecycle_event)
-                ]
-            },
-            fallbacks=[CommandHandler("cancel", self.cancel_command)]
-        )
+# Quick reply buttons mapped to the event description sent to the API
+BUTTON_DESCRIPTIONS = {
+    "🔴 Broken/Not Working": "This product is broken and not working properly",
+    "🔧 Fixed/Repaired": "I fixed and repaired this product, it's working now",
+    "🛒 Just Bought": "I just purchased this product",
+    "♻️ Recycled/Disposed": "I recycled or disposed of this product",
+    "🎁 Sold/Gifted": "I sold or gave away this product",
+    "⬆️ Upgraded/Modified": "I upgraded or modified this product",
+    "🧽 Cleaned/Maintained": "I cleaned and maintained this product",
+    "✅ Working Great": "This product is working great with no issues"
+}
 
-        self.app.add_handler(conv_handler)
+# Quick reply buttons that steer the conversation instead of describing an event
+CUSTOM_DESCRIPTION_BUTTON = "📝 Custom Description"
+SEND_PHOTO_BUTTON = "📸 I'll send a photo"
+TEXT_ONLY_BUTTON = "📝 Continue with text only"
 
-        # Error handler
-        self.app.add_error_handler(self.error_handler)
+# Reply keyboards are immutable, so share one instance of each
+PHOTO_KEYBOARD = ReplyKeyboardMarkup([
+    ["🔴 Broken/Not Working", "🔧 Fixed/Repaired"],
+    ["🛒 Just Bought", "♻️ Recycled/Disposed"],
+    ["🎁 Sold/Gifted", "⬆️ Upgraded/Modified"],
+    ["🧽 Cleaned/Maintained", "✅ Working Great"],
+    [CUSTOM_DESCRIPTION_BUTTON]
+], resize_keyboard=True, one_time_keyboard=True)
+TEXT_ONLY_KEYBOARD = ReplyKeyboardMarkup([
+    [SEND_PHOTO_BUTTON, TEXT_ONLY_BUTTON]
+], resize_keyboard=True, one_time_keyboard=True)
+REMOVE_KEYBOARD = ReplyKeyboardRemove()
 
-    async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /start command"""
-        user = update.effective_user
-        welcome_message = f"""
+
+# Typed views of the Life app API responses; unknown fields are ignored
+class TelegramUser(msgspec.Struct):
+    name: Optional[str] = None
+    linkedAt: Optional[str] = None
+
+
+class StatusStats(msgspec.Struct):
+    trackedProducts: int = 0
+
+
+class Activity(msgspec.Struct):
+    stepIcon: str = '📝'
+    stepLabel: str = 'Event'
+    productName: str = 'Product'
+
+
+class StatusResponse(msgspec.Struct):
+    linked: bool = False
+    user: Optional[TelegramUser] = None
+    stats: Optional[StatusStats] = None
+    recentActivity: List[Activity] = []
+
+
+class TrackedProduct(msgspec.Struct):
+    name: str
+    ecoScore: Optional[Union[int, float]] = None
+
+
+class ProductsStats(msgspec.Struct):
+    avgEcoScore: Union[int, float] = 0
+
+
+class ProductsResponse(msgspec.Struct):
+    linked: bool = False
+    products: List[TrackedProduct] = []
+    stats: Optional[ProductsStats] = None
+
+
+class LifecycleStep(msgspec.Struct):
+    title: str
+    description: Optional[str] = None
+
+
+class MatchedProduct(msgspec.Struct):
+    name: str
+
+
+class MatchInfo(msgspec.Struct):
+    confidence: Union[int, float]
+    message: str
+
+
+class EventResponse(msgspec.Struct):
+    success: bool = False
+    message: Optional[str] = None
+    error: Optional[str] = None
+    lifecycleStep: Optional[LifecycleStep] = None
+    matchedProduct: Optional[MatchedProduct] = None
+    matchInfo: Optional[MatchInfo] = None
+
+
+# Command replies, built once at import time and filled in with format_map
+START_TEMPLATE = """
 🌱 *Welcome to Life App Lifecycle Tracker!*
 
-Hi {user.first_name}! I help you track your product lifecycle events.
+Hi {first_name}! I help you track your product lifecycle events.
 
 *What I can do:*
 📸 Analyze product photos
@@ -114,16 +192,9 @@ Hi {user.first_name}! I help you track your product lifecycle events.
 /cancel - Cancel current operation
 
 Ready to start tracking? Send me a photo! 📸
-        """
-
-        await update.message.reply_text(
-            welcome_message,
-            parse_mode=ParseMode.MARKDOWN
-        )
+"""
 
-    async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /help command"""
-        help_text = """
+HELP_TEXT = """
 🤖 *Life App Bot Help*
 
 *How to use:*
@@ -156,20 +227,9 @@ Ready to start tracking? Send me a photo! 📸
 /cancel - Cancel operation
 
 Need help? Contact support in the Life app! 💚
-        """
-
-        await update.message.reply_text(
-            help_text,
-            parse_mode=ParseMode.MARKDOWN
-        )
-
-    async def link_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /link command - provides instructions for linking account"""
-        user = update.effective_user
-        telegram_id = str(user.id)
-        username = user.username or "No username"
+"""
 
-        link_message = f"""
+LINK_TEMPLATE = """
 🔗 *Link Your Life App Account*
 
 To connect this Telegram account with your Life app:
@@ -177,7 +237,7 @@ To connect this Telegram account with your Life app:
 *Your Telegram Info:*
 • ID: `{telegram_id}`
 • Username: @{username}
-• Name: {user.first_name} {user.last_name or ""}
+• Name: {first_name} {last_name}
 
 *Steps to link:*
 1. Open the Life app on your browser
@@ -193,38 +253,24 @@ To connect this Telegram account with your Life app:
 ✅ Get personalized insights
 
 Once linked, just send photos + descriptions! 📸
-        """
-
-        await update.message.reply_text(
-            link_message,
-            parse_mode=ParseMode.MARKDOWN
-        )
-
-    async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Check user's account linking status"""
-        user = update.effective_user
-        telegram_id = str(user.id)
-
-        # Check if user is linked by making API call
-        status_info = await self.check_user_status(telegram_id)
+"""
 
-        if status_info['linked']:
-            status_message = f"""
+STATUS_LINKED_TEMPLATE = """
 ✅ *Account Status: Linked*
 
 *Your Info:*
 • Telegram ID: `{telegram_id}`
-• Life App User: {status_info['name']}
-• Tracked Products: {status_info['tracked_count']}
-• Linked Since: {status_info['linked_date']}
+• Life App User: {name}
+• Tracked Products: {tracked_count}
+• Linked Since: {linked_date}
 
 *Recent Activity:*
-{status_info['recent_activity']}
+{recent_activity}
 
 🎉 You're all set! Send me photos to track events.
-            """
-        else:
-            status_message = f"""
+"""
+
+STATUS_NOT_LINKED_TEMPLATE = """
 ❌ *Account Status: Not Linked*
 
 Your Telegram account is not yet connected to the Life app.
@@ -235,7 +281,196 @@ Your Telegram account is not yet connected to the Life app.
 3. Enter your ID: `{telegram_id}`
 
 Need help? Check /help for more info!
-            """
+"""
+
+PRODUCTS_TEMPLATE = """
+📦 *Your Tracked Products*
+
+{products_list}
+
+*Total Products:* {product_count}
+*Average Eco Score:* {avg_score}/100
+
+💡 Send me photos of these products with descriptions to track lifecycle events!
+"""
+
+NO_PRODUCTS_TEXT = """
+📦 *No Products Tracked Yet*
+
+You haven't tracked any products in the Life app yet.
+
+*To start tracking:*
+1. Visit Life app in your browser
+2. Use the browser extension or manual tracking
+3. Come back here to report lifecycle events!
+
+🌱 Start your sustainability journey today!
+"""
+
+
+class LifeBot:
+    def __init__(self):
+        self.app = (
+            Application.builder()
+            .token(BOT_TOKEN)
+            # HTTP/2 lets concurrent Bot API calls share one connection
+            .request(HTTPXRequest(
+                http_version="2",
+                connection_pool_size=64,
+                connect_timeout=5,
+                read_timeout=20,
+                pool_timeout=5
+            ))
+            .get_updates_request(HTTPXRequest(
+                http_version="2",
+                connection_pool_size=16,
+                pool_timeout=5
+            ))
+            .post_shutdown(self.on_shutdown)
+            .build()
+        )
+        # Control buttons answered with a prompt rather than an API call
+        self.control_handlers = {
+            CUSTOM_DESCRIPTION_BUTTON: self.ask_custom_description,
+            SEND_PHOTO_BUTTON: self.ask_for_photo
+        }
+        # Shared HTTP session so keep-alive connections to the API are reused
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._download_sem = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+        self._upload_sem = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+        # telegram_id -> (expires_at, response) for repeated commands
+        self._status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._products_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self.setup_handlers()
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    # aiodns-backed resolver keeps lookups off the thread pool
+                    resolver=aiohttp.AsyncResolver(),
+                    limit=100,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300
+                ),
+                timeout=LOOKUP_TIMEOUT
+            )
+        return self._session
+
+    def _cache_get(self, cache: Dict[str, Tuple[float, Dict[str, Any]]], key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached response if it has not expired"""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del cache[key]
+            return None
+        return value
+
+    def _cache_set(self, cache: Dict[str, Tuple[float, Dict[str, Any]]], key: str, value: Dict[str, Any]):
+        """Cache a response, evicting the oldest entry when full"""
+        cache.pop(key, None)
+        if len(cache) >= API_CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)))
+        cache[key] = (time.monotonic() + API_CACHE_TTL, value)
+
+    def invalidate_user_cache(self, telegram_id: str):
+        """Forget cached responses after the user's data changed"""
+        self._status_cache.pop(telegram_id, None)
+        self._products_cache.pop(telegram_id, None)
+
+    async def on_shutdown(self, application: Application):
+        """Close the shared HTTP session when the bot stops"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def setup_handlers(self):
+        """Set up bot command and message handlers"""
+
+        # Commands
+        self.app.add_handler(CommandHandler("start", self.start_command))
+        self.app.add_handler(CommandHandler("help", self.help_command))
+        self.app.add_handler(CommandHandler("link", self.link_command))
+        self.app.add_handler(CommandHandler("status", self.status_command))
+        self.app.add_handler(CommandHandler("products", self.products_command))
+
+        # Conversation handler for lifecycle events
+        conv_handler = ConversationHandler(
+            entry_points=[
+                MessageHandler(filters.PHOTO, self.handle_photo),
+                MessageHandler(filters.TEXT & ~filters.COMMAND,
+                               self.handle_text_only)
+            ],
+            states={
+                WAITING_FOR_EVENT: [
+                    MessageHandler(filters.TEXT, self.process_lifecycle_event)
+                ],
+                WAITING_FOR_DESCRIPTION: [
+                    MessageHandler(filters.TEXT, self.process_lifecycle_event)
+                ],
+                ConversationHandler.TIMEOUT: [
+                    TypeHandler(Update, self.conversation_timeout)
+                ]
+            },
+            fallbacks=[CommandHandler("cancel", self.cancel_command)],
+            conversation_timeout=CONVERSATION_TIMEOUT
+        )
+
+        self.app.add_handler(conv_handler)
+
+        # Error handler
+        self.app.add_error_handler(self.error_handler)
+
+    async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /start command"""
+        user = update.effective_user
+        await update.message.reply_text(
+            START_TEMPLATE.format_map({"first_name": user.first_name}),
+            parse_mode=ParseMode.MARKDOWN
+        )
+
+    async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /help command"""
+        await update.message.reply_text(
+            HELP_TEXT,
+            parse_mode=ParseMode.MARKDOWN
+        )
+
+    async def link_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /link command - provides instructions for linking account"""
+        user = update.effective_user
+        telegram_id = str(user.id)
+        username = user.username or "No username"
+
+        await update.message.reply_text(
+            LINK_TEMPLATE.format_map({
+                "telegram_id": telegram_id,
+                "username": username,
+                "first_name": user.first_name,
+                "last_name": user.last_name or ""
+            }),
+            parse_mode=ParseMode.MARKDOWN
+        )
+
+    async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Check user's account linking status"""
+        user = update.effective_user
+        telegram_id = str(user.id)
+
+        # Check if user is linked by making API call
+        status_info = await self.check_user_status(telegram_id)
+
+        if status_info['linked']:
+            status_message = STATUS_LINKED_TEMPLATE.format_map(
+                {**status_info, "telegram_id": telegram_id}
+            )
+        else:
+            status_message = STATUS_NOT_LINKED_TEMPLATE.format_map(
+                {"telegram_id": telegram_id}
+            )
 
         await update.message.reply_text(
             status_message,
@@ -257,34 +492,18 @@ Need help? Check /help for more info!
             return
 
         if products_info['products']:
-            products_list = "\n".join([
-                f"• {p['name']} (Score: {p['ecoScore']}/100)"
+            products_list = "\n".join(
+                f"• {p.name} (Score: {p.ecoScore}/100)"
                 for p in products_info['products']
-            ])
-
-            products_message = f"""
-📦 *Your Tracked Products*
-
-{products_list}
-
-*Total Products:* {len(products_info['products'])}
-*Average Eco Score:* {products_info['avg_score']}/100
+            )
 
-💡 Send me photos of these products with descriptions to track lifecycle events!
-            """
+            products_message = PRODUCTS_TEMPLATE.format_map({
+                "products_list": products_list,
+                "product_count": len(products_info['products']),
+                "avg_score": products_info['avg_score']
+            })
         else:
-            products_message = """
-📦 *No Products Tracked Yet*
-
-You haven't tracked any products in the Life app yet.
-
-*To start tracking:*
-1. Visit Life app in your browser
-2. Use the browser extension or manual tracking
-3. Come back here to report lifecycle events!
-
-🌱 Start your sustainability journey today!
-            """
+            products_message = NO_PRODUCTS_TEXT
 
         await update.message.reply_text(
             products_message,
@@ -293,22 +512,29 @@ You haven't tracked any products in the Life app yet.
 
     async def handle_photo(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle photo messages - start lifecycle event processing"""
-        await update.message.reply_text(
-            "📸 Great! I see you've sent a photo. Now tell me what happened with this product:",
-            reply_markup=ReplyKeyboardMarkup([
-                ["🔴 Broken/Not Working", "🔧 Fixed/Repaired"],
-                ["🛒 Just Bought", "♻️ Recycled/Disposed"],
-                ["🎁 Sold/Gifted", "⬆️ Upgraded/Modified"],
-                ["🧽 Cleaned/Maintained", "✅ Working Great"],
-                ["📝 Custom Description"]
-            ], resize_keyboard=True, one_time_keyboard=True)
+        # Largest size that fits MAX_PHOTO_DIMENSION is plenty for product
+        # identification and much cheaper to download and upload
+        photo = next(
+            (p for p in reversed(update.message.photo)
+             if max(p.width, p.height) <= MAX_PHOTO_DIMENSION),
+            update.message.photo[-1]
         )
 
         # Store photo info in context
-        photo = update.message.photo[-1]  # Get highest resolution
         context.user_data['photo_file_id'] = photo.file_id
         context.user_data['photo_size'] = photo.file_size
 
+        # Start downloading now so the file is ready by the time the user
+        # has picked a description
+        context.user_data['photo_task'] = asyncio.create_task(
+            self.get_photo_data(context, photo.file_id)
+        )
+
+        await update.message.reply_text(
+            "📸 Great! I see you've sent a photo. Now tell me what happened with this product:",
+            reply_markup=PHOTO_KEYBOARD
+        )
+
         return WAITING_FOR_DESCRIPTION
 
     async def handle_text_only(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -316,9 +542,7 @@ You haven't tracked any products in the Life app yet.
         await update.message.reply_text(
             "📝 I see you've described something. For better product identification, could you also send a photo?\n\n" +
             "Or if you want to proceed with text only, I'll try to match based on your description:",
-            reply_markup=ReplyKeyboardMarkup([
-                ["📸 I'll send a photo", "📝 Continue with text only"]
-            ], resize_keyboard=True, one_time_keyboard=True)
+            reply_markup=TEXT_ONLY_KEYBOARD
         )
 
         context.user_data['text_description'] = update.message.text
@@ -326,84 +550,68 @@ You haven't tracked any products in the Life app yet.
 
     async def process_lifecycle_event(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Process the lifecycle event with photo and description"""
-        user = update.effective_user
-        telegram_id = str(user.id)
-
         # Get description from user
         description = update.message.text
 
+        # Navigation buttons only prompt for more input, so answer them
+        # before doing any event work
+        control_handler = self.control_handlers.get(description)
+        if control_handler is not None:
+            return await control_handler(update, context)
+
+        telegram_id = str(update.effective_user.id)
+
         # Handle quick reply buttons
-        if description in ["🔴 Broken/Not Working", "🔧 Fixed/Repaired", "🛒 Just Bought",
-                           "♻️ Recycled/Disposed", "🎁 Sold/Gifted", "⬆️ Upgraded/Modified",
-                           "🧽 Cleaned/Maintained", "✅ Working Great"]:
-            # Convert emoji buttons to descriptive text
-            description_mapping = {
-                "🔴 Broken/Not Working": "This product is broken and not working properly",
-                "🔧 Fixed/Repaired": "I fixed and repaired this product, it's working now",
-                "🛒 Just Bought": "I just purchased this product",
-                "♻️ Recycled/Disposed": "I recycled or disposed of this product",
-                "🎁 Sold/Gifted": "I sold or gave away this product",
-                "⬆️ Upgraded/Modified": "I upgraded or modified this product",
-                "🧽 Cleaned/Maintained": "I cleaned and maintained this product",
-                "✅ Working Great": "This product is working great with no issues"
-            }
-            description = description_mapping.get(description, description)
-        elif description == "📝 Custom Description":
-            await update.message.reply_text(
-                "Please describe what happened with your product:",
-                reply_markup=ReplyKeyboardRemove()
-            )
-            return WAITING_FOR_DESCRIPTION
-        elif description == "📸 I'll send a photo":
-            await update.message.reply_text(
-                "Perfect! Please send a photo of your product:",
-                reply_markup=ReplyKeyboardRemove()
-            )
-            return WAITING_FOR_IMAGE
-        elif description == "📝 Continue with text only":
+        if description == TEXT_ONLY_BUTTON:
             description = context.user_data.get(
                 'text_description', description)
+        else:
+            # Convert emoji buttons to descriptive text
+            description = BUTTON_DESCRIPTIONS.get(description, description)
 
-        # Show processing message
-        processing_msg = await update.message.reply_text(
+        # Show processing message without holding up the API call; the
+        # message is only needed once there is a result to edit into it
+        processing_task = asyncio.create_task(update.message.reply_text(
             "🔄 Processing your lifecycle event...\n" +
             "• Analyzing content\n" +
             "• Matching products\n" +
             "• Creating lifecycle step",
-            reply_markup=ReplyKeyboardRemove()
-        )
+            reply_markup=REMOVE_KEYBOARD
+        ))
 
         try:
-            # Get photo data if available
+            # Get photo data if available (download started in handle_photo)
             image_data = None
-            if 'photo_file_id' in context.user_data:
-                image_data = await self.get_photo_data(
-                    context,
-                    context.user_data['photo_file_id']
-                )
+            photo_task = context.user_data.pop('photo_task', None)
+            if photo_task is not None:
+                try:
+                    image_data = await asyncio.wait_for(photo_task, timeout=10)
+                except asyncio.TimeoutError:
+                    logger.warning("Timed out downloading photo, continuing without it")
 
             # Send to API
             result = await self.send_to_api(telegram_id, description, image_data)
 
-            # Debug log the response
-            logger.info(f"API response: {result}")
+            if result.success:
+                # New lifecycle step makes cached /status activity stale
+                self.invalidate_user_cache(telegram_id)
 
-            if result and result.get('success', False):
                 success_message = f"""
 ✅ *Lifecycle Event Recorded!*
 
-*Product:* {result['matchedProduct']['name']}
-*Event:* {result['lifecycleStep']['title']}
-*Match Confidence:* {result['matchInfo']['confidence']}%
+*Product:* {result.matchedProduct.name}
+*Event:* {result.lifecycleStep.title}
+*Match Confidence:* {result.matchInfo.confidence}%
 
-{result['matchInfo']['message']}
+{result.matchInfo.message}
 
-*Description:* {result['lifecycleStep']['description']}
+*Description:* {result.lifecycleStep.description}
 
 🌱 Check your Life app dashboard to see the full timeline!
                 """
 
                 try:
+                    processing_msg = await processing_task
                     await processing_msg.edit_text(
                         success_message,
                         parse_mode=ParseMode.MARKDOWN
@@ -416,8 +624,9 @@ You haven't tracked any products in the Life app yet.
                         parse_mode=ParseMode.MARKDOWN
                     )
             else:
-                error_message = f"❌ {result.get('message', result.get('error', 'Failed to process event'))}"
+                error_message = f"❌ {result.message or result.error or 'Failed to process event'}"
                 try:
+                    processing_msg = await processing_task
                     await processing_msg.edit_text(error_message)
                 except Exception as edit_error:
                     # If editing fails, send a new message instead
@@ -427,6 +636,7 @@ You haven't tracked any products in the Life app yet.
         except Exception as e:
             logger.error(f"Error processing lifecycle event: {e}")
             try:
+                processing_msg = await processing_task
                 await processing_msg.edit_text(
                     "❌ Sorry, something went wrong processing your event. Please try again later."
                 )
@@ -441,76 +651,113 @@ You haven't tracked any products in the Life app yet.
         context.user_data.clear()
         return ConversationHandler.END
 
+    async def ask_custom_description(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Prompt for a free-text description of the event"""
+        await update.message.reply_text(
+            "Please describe what happened with your product:",
+            reply_markup=REMOVE_KEYBOARD
+        )
+        return WAITING_FOR_DESCRIPTION
+
+    async def ask_for_photo(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Prompt for a photo of the product"""
+        await update.message.reply_text(
+            "Perfect! Please send a photo of your product:",
+            reply_markup=REMOVE_KEYBOARD
+        )
+        return WAITING_FOR_IMAGE
+
     async def cancel_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Cancel current operation"""
-        context.user_data.clear()
+        self.reset_user_data(context)
         await update.message.reply_text(
             "❌ Operation cancelled. Send me a photo anytime to track a lifecycle event!",
-            reply_markup=ReplyKeyboardRemove()
+            reply_markup=REMOVE_KEYBOARD
         )
         return ConversationHandler.END
 
-    async def get_photo_data(self, context: ContextTypes.DEFAULT_TYPE, file_id: str) -> Optional[str]:
-        """Download photo and convert to base64"""
-        try:
-            file = await context.bot.get_file(file_id)
-            photo_bytes = await file.download_as_bytearray()
+    async def conversation_timeout(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Drop state left behind by an abandoned conversation"""
+        self.reset_user_data(context)
+
+    def reset_user_data(self, context: ContextTypes.DEFAULT_TYPE):
+        """Cancel any pending photo download and clear conversation data"""
+        photo_task = context.user_data.pop('photo_task', None)
+        if photo_task is not None:
+            photo_task.cancel()
+        context.user_data.clear()
 
-            # Convert to base64
-            photo_base64 = base64.b64encode(photo_bytes).decode('utf-8')
-            return f"data:image/jpeg;base64,{photo_base64}"
+    async def get_photo_data(self, context: ContextTypes.DEFAULT_TYPE, file_id: str) -> Optional[bytearray]:
+        """Download photo as raw bytes"""
+        try:
+            async with self._download_sem:
+                file = await context.bot.get_file(file_id)
+                return await file.download_as_bytearray()
 
         except Exception as e:
             logger.error(f"Error downloading photo: {e}")
             return None
 
-    async def send_to_api(self, telegram_id: str, text: str, image_data: Optional[str]) -> Dict[str, Any]:
+    async def send_to_api(self, telegram_id: str, text: str, image_data: Optional[bytearray]) -> EventResponse:
         """Send lifecycle event to Life app API"""
-        payload = {
-            "telegramId": telegram_id,
-            "text": text,
-            "botToken": BOT_SECRET,
-            "timestamp": int(asyncio.get_event_loop().time())
-        }
+        # Multipart upload sends the photo as raw bytes instead of base64 JSON
+        form = aiohttp.FormData()
+        form.add_field("telegramId", telegram_id)
+        form.add_field("text", text)
+        form.add_field("botToken", BOT_SECRET)
+        form.add_field("timestamp", str(int(time.time())))
 
         if image_data:
-            payload["imageBase64"] = image_data
+            form.add_field(
+                "image",
+                image_data,
+                filename="photo.jpg",
+                content_type="image/jpeg"
+            )
 
-        async with aiohttp.ClientSession() as session:
+        session = await self._ensure_session()
+        async with self._upload_sem:
             async with session.post(
                 f"{API_BASE_URL}/lifecycle/telegram-event",
-                json=payload,
-                headers={"Content-Type": "application/json"}
+                data=form,
+                timeout=EVENT_TIMEOUT
             ) as response:
-                print(await response.json())
-                return await response.json()
+                result = msgspec.json.decode(await response.read(), type=EventResponse)
+                logger.debug("API response: %s", result)
+                return result
 
     async def check_user_status(self, telegram_id: str) -> Dict[str, Any]:
         """Check if user is linked and get account info"""
+        cached = self._cache_get(self._status_cache, telegram_id)
+        if cached is not None:
+            return cached
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{API_BASE_URL}/telegram/status",
-                    params={"telegramId": telegram_id}
-                ) as response:
-                    data = await response.json()
-
-                    if data.get('linked'):
-                        return {
-                            "linked": True,
-                            "name": data['user']['name'] or 'Unknown',
-                            "tracked_count": data['stats']['trackedProducts'],
-                            "linked_date": data['user']['linkedAt'],
-                            "recent_activity": self.format_recent_activity(data.get('recentActivity', []))
-                        }
-                    else:
-                        return {
-                            "linked": False,
-                            "name": "Unknown",
-                            "tracked_count": 0,
-                            "linked_date": "Not linked",
-                            "recent_activity": "No recent activity"
-                        }
+            session = await self._ensure_session()
+            async with session.get(
+                f"{API_BASE_URL}/telegram/status",
+                params={"telegramId": telegram_id}
+            ) as response:
+                data = msgspec.json.decode(await response.read(), type=StatusResponse)
+
+                if data.linked:
+                    status = {
+                        "linked": True,
+                        "name": data.user.name or 'Unknown',
+                        "tracked_count": data.stats.trackedProducts,
+                        "linked_date": data.user.linkedAt,
+                        "recent_activity": self.format_recent_activity(data.recentActivity)
+                    }
+                    self._cache_set(self._status_cache, telegram_id, status)
+                    return status
+                else:
+                    return {
+                        "linked": False,
+                        "name": "Unknown",
+                        "tracked_count": 0,
+                        "linked_date": "Not linked",
+                        "recent_activity": "No recent activity"
+                    }
         except Exception as e:
             logger.error(f"Error checking user status: {e}")
             return {
@@ -523,27 +770,33 @@ You haven't tracked any products in the Life app yet.
 
     async def get_user_products(self, telegram_id: str) -> Dict[str, Any]:
         """Get user's tracked products"""
+        cached = self._cache_get(self._products_cache, telegram_id)
+        if cached is not None:
+            return cached
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{API_BASE_URL}/telegram/products",
-                    params={"telegramId": telegram_id}
-                ) as response:
-                    data = await response.json()
-
-                    if data.get('linked'):
-                        return {
-                            "linked": True,
-                            # Limit to first 10
-                            "products": data['products'][:10],
-                            "avg_score": data['stats']['avgEcoScore']
-                        }
-                    else:
-                        return {
-                            "linked": False,
-                            "products": [],
-                            "avg_score": 0
-                        }
+            session = await self._ensure_session()
+            async with session.get(
+                f"{API_BASE_URL}/telegram/products",
+                params={"telegramId": telegram_id}
+            ) as response:
+                data = msgspec.json.decode(await response.read(), type=ProductsResponse)
+
+                if data.linked:
+                    products = {
+                        "linked": True,
+                        # Limit to first 10
+                        "products": data.products[:10],
+                        "avg_score": data.stats.avgEcoScore
+                    }
+                    self._cache_set(self._products_cache, telegram_id, products)
+                    return products
+                else:
+                    return {
+                        "linked": False,
+                        "products": [],
+                        "avg_score": 0
+                    }
         except Exception as e:
             logger.error(f"Error fetching user products: {e}")
             return {
@@ -552,19 +805,15 @@ You haven't tracked any products in the Life app yet.
                 "avg_score": 0
             }
 
-    def format_recent_activity(self, activities: list) -> str:
+    def format_recent_activity(self, activities: List[Activity]) -> str:
         """Format recent activity for display"""
         if not activities:
             return "No recent activity"
 
-        activity_lines = []
-        for activity in activities[:3]:  # Show only last 3
-            icon = activity.get('stepIcon', '📝')
-            product = activity.get('productName', 'Product')
-            event = activity.get('stepLabel', 'Event')
-            activity_lines.append(f"{icon} {event}: {product}")
-
-        return "\n".join(activity_lines)
+        return "\n".join(
+            f"{activity.stepIcon} {activity.stepLabel}: {activity.productName}"
+            for activity in activities[:3]  # Show only last 3
+        )
 
     async def error_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle errors"""
@@ -578,7 +827,21 @@ You haven't tracked any products in the Life app yet.
     def run(self):
         """Start the bot"""
         logger.info("Starting Life App Telegram Bot...")
-        self.app.run_polling()
+
+        if not WEBHOOK_URL:
+            # Local development: no public HTTPS endpoint available
+            logger.info("TELEGRAM_WEBHOOK_URL not set, using long-polling")
+            self.app.run_polling()
+            return
+
+        # Telegram pushes updates to us instead of us polling getUpdates
+        self.app.run_webhook(
+            listen="0.0.0.0",
+            port=PORT,
+            url_path=BOT_TOKEN,
+            webhook_url=f"{WEBHOOK_URL.rstrip('/')}/{BOT_TOKEN}",
+            secret_token=WEBHOOK_SECRET
+        )
 
 
 def main():